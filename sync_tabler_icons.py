@@ -0,0 +1,399 @@
+"""Syncs the SVG icons from the tabler-icons repository into `tablerqicon/icons`.
+
+Only icons whose content hashes differ are copied. The `extended_tablerqicon.pyi` stubs and the
+`manifest.json` file of per-icon SHA-256 content hashes are regenerated in the same pass, and are
+written only when their content changes, so running the sync twice leaves the tree untouched.
+
+Usage:
+    python sync_tabler_icons.py                                # Fetch the latest icons from GitHub
+    python sync_tabler_icons.py --source path/to/tabler-icons  # Use a local tabler-icons checkout
+"""
+
+# Standard Library Imports
+# ------------------------
+import argparse
+from datetime import datetime, timezone
+import hashlib
+import json
+import keyword
+import os
+from pathlib import Path
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, NamedTuple, Optional
+
+# Constants Definition
+# --------------------
+# URL of the repository to be cloned
+REPO_URL = 'https://github.com/tabler/tabler-icons.git'
+# Branch of the repository to be synced
+BRANCH = 'master'
+# Target directory where the icons should be stored
+TARGET_DIRECTORY = Path(__file__).parent / 'tablerqicon'
+# Generated artifacts, the stubs file is relative to the target directory and the others to its 'icons' directory
+STUBS_FILE_NAME = 'extended_tablerqicon.pyi'
+MANIFEST_FILE_NAME = 'manifest.json'
+UPDATE_LOG_FILE_NAME = 'update.log'
+
+# Compile the regex pattern once, it must match the icon name sanitization of `tablerqicon.tablerqicon.to_icon_name`
+INVALID_ICON_NAME_CHARS_PATTERN = re.compile(r'[\W_]+')
+
+STUBS_HEADER = """'''
+extended_tablerqicon.pyi
+--------------------------------------------------------------------------------
+This file is generated by the `sync_tabler_icons.py` script.
+--------------------------------------------------------------------------------
+NOTE: DO NOT EDIT THIS FILE DIRECTLY.
+--------------------------------------------------------------------------------
+This Python Interface (pyi) file provides an interface for the
+ExtendedTablerQIcon class which extends from the TablerQIcon class.
+
+The icons are cloned from the Tabler Icons GitHub repository
+(https://github.com/tabler/tabler-icons/tree/master/icons) into the
+local directory `tablerqicon/icons` as SVG files.
+
+Each SVG file in this directory is reflected as an attribute in this file
+that returns a QIcon object.
+
+The `sync_tabler_icons.py` script updates this file whenever the script is run,
+to reflect any changes in the Tabler Icons repository.
+--------------------------------------------------------------------------------
+'''
+
+from .tablerqicon import TablerQIcon
+
+class QIcon: ...
+
+class ExtendedTablerQIcon(TablerQIcon):
+"""
+
+
+# Classes Definition
+# ------------------
+class SyncResult(NamedTuple):
+    """Result of syncing the icons, listing the SVG file names per kind of change.
+
+    The content hashes of the icons in the target directory after the sync are kept in `icon_hashes`,
+    so the generated artifacts don't need the directory to be hashed again.
+    """
+    added: List[str]
+    changed: List[str]
+    removed: List[str]
+    unchanged: List[str]
+    icon_hashes: Dict[str, str]
+
+    @property
+    def num_icons_before(self) -> int:
+        """int: The number of icons in the target directory before the sync."""
+        return len(self.icon_hashes) - len(self.added) + len(self.removed)
+
+    @property
+    def has_changes(self) -> bool:
+        """bool: True if any icon was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+# Functions Definition
+# --------------------
+def to_icon_name(file_name: str) -> str:
+    """Converts an SVG file name into a valid Python attribute name.
+
+    Args:
+        file_name (str): The SVG file name, e.g. 'arrow-left.svg'.
+
+    Returns:
+        str: The sanitized icon name, e.g. 'arrow_left'.
+    """
+    # Use regex to replace invalid characters with an underscore
+    icon_name = INVALID_ICON_NAME_CHARS_PATTERN.sub('_', file_name.split('.')[0])
+    # Check if the icon name is a Python keyword or starts with a number
+    if keyword.iskeyword(icon_name) or icon_name[0].isdigit():
+        icon_name = "_" + icon_name
+
+    return icon_name
+
+
+def hash_icons(directory: Path) -> Dict[str, str]:
+    """Computes the SHA-256 content hash of each SVG file in a directory.
+
+    Args:
+        directory (Path): The directory containing the SVG files.
+
+    Returns:
+        Dict[str, str]: The SVG file names as keys and their hex digests as values, sorted by file name.
+    """
+    if not directory.is_dir():
+        return dict()
+
+    svg_files = sorted(file for file in os.listdir(directory) if file.endswith('.svg'))
+    return {svg_file: hashlib.sha256((directory / svg_file).read_bytes()).hexdigest() for svg_file in svg_files}
+
+
+def sync_icons(source_directory: Path, target_directory: Path, prune: bool = False) -> SyncResult:
+    """Copies the icons whose content differs from the source directory to the target directory.
+
+    Args:
+        source_directory (Path): The directory containing the upstream SVG files.
+        target_directory (Path): The directory to sync the SVG files into.
+        prune (bool, optional): If True, icons that no longer exist upstream are removed. Defaults to False.
+
+    Returns:
+        SyncResult: The SVG file names added, changed, removed and left unchanged, and the content hashes
+            of the icons in the target directory after the sync.
+    """
+    source_hashes = hash_icons(source_directory)
+    target_hashes = hash_icons(target_directory)
+
+    result = SyncResult(added=[], changed=[], removed=[], unchanged=[], icon_hashes=target_hashes)
+
+    for svg_file, source_hash in source_hashes.items():
+        target_hash = target_hashes.get(svg_file)
+        if target_hash == source_hash:
+            result.unchanged.append(svg_file)
+            continue
+
+        (result.added if target_hash is None else result.changed).append(svg_file)
+
+    if prune:
+        result.removed.extend(svg_file for svg_file in target_hashes if svg_file not in source_hashes)
+
+    # Apply the changes to the target directory
+    target_directory.mkdir(parents=True, exist_ok=True)
+    for svg_file in result.added + result.changed:
+        shutil.copyfile(source_directory / svg_file, target_directory / svg_file)
+        target_hashes[svg_file] = source_hashes[svg_file]
+    for svg_file in result.removed:
+        (target_directory / svg_file).unlink()
+        del target_hashes[svg_file]
+
+    return result
+
+
+def generate_stubs(icon_hashes: Dict[str, str]) -> str:
+    """Generates the content of the `extended_tablerqicon.pyi` stubs file.
+
+    Args:
+        icon_hashes (Dict[str, str]): The SVG file names of the synced icons as keys.
+
+    Returns:
+        str: The content of the stubs file, with the icon attributes sorted by name.
+    """
+    icon_names = sorted(to_icon_name(svg_file) for svg_file in icon_hashes)
+    return STUBS_HEADER + ''.join(f'    {icon_name}: QIcon\n' for icon_name in icon_names)
+
+
+def generate_manifest(icon_hashes: Dict[str, str]) -> str:
+    """Generates the content of the manifest file of per-icon content hashes.
+
+    Args:
+        icon_hashes (Dict[str, str]): The SVG file names as keys and their SHA-256 hex digests as values.
+
+    Returns:
+        str: The manifest as JSON, with the SVG file names sorted.
+    """
+    return json.dumps(icon_hashes, indent=0, sort_keys=True) + '\n'
+
+
+def write_if_changed(file_path: Path, content: str) -> bool:
+    """Writes the content to a file, unless the file already has the same content.
+
+    Args:
+        file_path (Path): The path of the file to write.
+        content (str): The content to write.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    if file_path.is_file() and file_path.read_text(encoding='utf-8') == content:
+        return False
+
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as file:
+        file.write(content)
+    return True
+
+
+def fetch_icons(checkout_directory: Path, repo_url: str = REPO_URL, branch: str = BRANCH) -> None:
+    """Fetches only the 'icons' directory of the latest commit of the tabler-icons repository.
+
+    Args:
+        checkout_directory (Path): The empty directory to check out the repository into.
+        repo_url (str, optional): The URL of the repository. Defaults to REPO_URL.
+        branch (str, optional): The branch to fetch. Defaults to BRANCH.
+
+    Raises:
+        subprocess.CalledProcessError: If any of the git commands fails.
+    """
+
+    def git(*args: str) -> None:
+        subprocess.run(['git', '-C', str(checkout_directory), *args], check=True)
+
+    # Initialize a new git repository and fetch the latest commit without the blobs (file contents)
+    git('init')
+    git('remote', 'add', 'origin', repo_url)
+    git('fetch', '--depth', '1', '--filter=blob:none', 'origin', branch)
+    # Check out only the 'icons' directory using sparse-checkout
+    git('config', 'core.sparseCheckout', 'true')
+    (checkout_directory / '.git' / 'info' / 'sparse-checkout').write_text('icons/*\n')
+    git('checkout', branch)
+
+
+def get_latest_commit(checkout_directory: Path) -> str:
+    """Gets the latest commit of a checkout as a one line summary.
+
+    Args:
+        checkout_directory (Path): The checkout directory.
+
+    Returns:
+        str: The latest commit, or 'unknown' if the directory is not a git checkout.
+    """
+    return _get_git_output(checkout_directory, 'log', '--oneline', '-1') or 'unknown'
+
+
+def get_current_branch(checkout_directory: Path) -> str:
+    """Gets the branch checked out in a checkout.
+
+    Args:
+        checkout_directory (Path): The checkout directory.
+
+    Returns:
+        str: The current branch, or 'unknown' if the directory is not a git checkout or its HEAD is detached.
+    """
+    branch = _get_git_output(checkout_directory, 'rev-parse', '--abbrev-ref', 'HEAD')
+    return branch if branch and branch != 'HEAD' else 'unknown'
+
+
+def write_update_log(update_log_path: Path, result: SyncResult, repo_url: str, branch: str, commit: str) -> None:
+    """Writes the sync details to the update log.
+
+    Args:
+        update_log_path (Path): The path of the update log.
+        result (SyncResult): The result of the sync.
+        repo_url (str): The URL or path of the synced repository.
+        branch (str): The synced branch.
+        commit (str): The synced commit.
+    """
+    sync_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+    lines = [
+        f'repository: {repo_url}',
+        f'branch: {branch}',
+        f'synced: {sync_time}',
+        f'icons_before: {result.num_icons_before}',
+        f'commit: {commit}',
+        f'icons_after: {len(result.icon_hashes)}',
+        f'icons_added: {len(result.added)}',
+        f'icons_changed: {len(result.changed)}',
+        f'icons_removed: {len(result.removed)}',
+    ]
+    with open(update_log_path, 'w', encoding='utf-8', newline='\n') as update_log_file:
+        update_log_file.write('\n'.join(lines) + '\n')
+
+
+def sync(checkout_directory: Path,
+         repo_url: str,
+         branch: str,
+         target_directory: Path = TARGET_DIRECTORY,
+         prune: bool = False) -> SyncResult:
+    """Syncs the icons from a tabler-icons checkout and regenerates the stubs and manifest.
+
+    Args:
+        checkout_directory (Path): The tabler-icons checkout, or directly its 'icons' directory.
+        repo_url (str): The URL or path of the synced repository, recorded in the update log.
+        branch (str): The synced branch, recorded in the update log.
+        target_directory (Path, optional): The package directory to sync the icons into. Defaults to TARGET_DIRECTORY.
+        prune (bool, optional): If True, icons that no longer exist upstream are removed. Defaults to False.
+
+    Returns:
+        SyncResult: The result of the sync.
+
+    Raises:
+        FileNotFoundError: If the checkout doesn't contain an 'icons' directory.
+    """
+    source_directory = checkout_directory / 'icons'
+    if not source_directory.is_dir():
+        source_directory = checkout_directory
+    if not any(file.endswith('.svg') for file in os.listdir(source_directory)):
+        raise FileNotFoundError(f'No SVG icons found in {checkout_directory}')
+
+    target_icons_directory = target_directory / 'icons'
+    result = sync_icons(source_directory, target_icons_directory, prune=prune)
+
+    # Regenerate the stubs and the manifest from the hashes of the synced icons in one pass
+    write_if_changed(target_directory / STUBS_FILE_NAME, generate_stubs(result.icon_hashes))
+    write_if_changed(target_icons_directory / MANIFEST_FILE_NAME, generate_manifest(result.icon_hashes))
+
+    # Only log the sync when icons actually changed, keeping no-op syncs reproducible
+    if result.has_changes:
+        write_update_log(target_icons_directory / UPDATE_LOG_FILE_NAME, result, repo_url, branch,
+                         get_latest_commit(checkout_directory))
+
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point of the sync script.
+
+    Args:
+        argv (List[str], optional): The command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description='Sync the SVG icons from the tabler-icons repository.')
+    parser.add_argument('-s', '--source',
+                        help='Local tabler-icons checkout, or its icons directory, to sync from instead of fetching.')
+    parser.add_argument('-b', '--branch',
+                        help=f"Branch to fetch. Defaults to '{BRANCH}'. Not allowed with --source, "
+                        'the branch checked out in the local checkout is recorded instead.')
+    parser.add_argument('--prune', action='store_true', help='Remove the icons that no longer exist upstream.')
+    args = parser.parse_args(argv)
+
+    if args.source and args.branch:
+        parser.error('--branch cannot be used with --source, check out the branch in the local checkout instead')
+
+    if args.source:
+        source = Path(args.source).resolve()
+        # Record the branch actually checked out, since the local checkout is used as is
+        result = sync(source, str(source), get_current_branch(source), prune=args.prune)
+    else:
+        branch = args.branch or BRANCH
+        with tempfile.TemporaryDirectory(prefix='tabler-icons-') as temp_directory:
+            fetch_icons(Path(temp_directory), REPO_URL, branch)
+            result = sync(Path(temp_directory), REPO_URL, branch, prune=args.prune)
+
+    print(f'Icons synced: {len(result.added)} added, {len(result.changed)} changed, '
+          f'{len(result.removed)} removed, {len(result.unchanged)} unchanged.')
+    return 0
+
+
+# Private Functions
+# -----------------
+def _get_git_output(checkout_directory: Path, *args: str) -> Optional[str]:
+    """Runs a git command in a checkout and returns its output.
+
+    Args:
+        checkout_directory (Path): The checkout directory.
+        *args (str): The arguments of the git command.
+
+    Returns:
+        Optional[str]: The stripped output of the command, or None if git is unavailable or the command fails.
+    """
+    try:
+        process = subprocess.run(['git', '-C', str(checkout_directory), *args],
+                                 check=True,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.DEVNULL,
+                                 universal_newlines=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return process.stdout.strip()
+
+
+# Main Execution
+# --------------
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +1 @@
-from .tablerqicon import TablerQIcon, use_backend, __version__
+from .tablerqicon import TablerQIcon, use_backend, use_icon_bundle, __version__
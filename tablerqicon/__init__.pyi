@@ -1,5 +1,10 @@
+from pathlib import Path
+from typing import Optional, Union
+
 from .extended_tablerqicon import ExtendedTablerQIcon
 
 def use_backend(lib_name: str = None) -> None: ...
 
+def use_icon_bundle(bundle_path: Optional[Union[str, Path]] = None) -> None: ...
+
 class TablerQIcon(ExtendedTablerQIcon): ...
@@ -0,0 +1,402 @@
+# Standard Library Imports
+# ------------------------
+import argparse
+import ast
+import fnmatch
+import json
+import os
+from pathlib import Path
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Union
+import zipfile
+
+# Local Imports
+# -------------
+from .tablerqicon import BUNDLE_INDEX_FILE_NAME, TABLER_ICONS_SVG_DIRECTORY, scan_icon_directory, to_icon_name
+
+# Constants Definition
+# --------------------
+# Name of the class whose instances and class attributes are detected as icon usages
+ICON_CLASS_NAME = 'TablerQIcon'
+# Instance properties applying transformations, which can be chained before the icon name
+TRANSFORMATION_PROPERTY_NAMES = ('flip', 'flop')
+
+# Patterns matching icon usages in any source file, the icon name is captured in the 'name' group
+ICON_USAGE_PATTERNS = [
+    # TablerQIcon.<name>, e.g. TablerQIcon.refresh
+    re.compile(r'\bTablerQIcon\.(?P<name>\w+)'),
+    # <...icon>['<name>'], e.g. tabler_icon['arrow-left']
+    re.compile(r'\w*icons?\s*\[\s*([\'"])(?P<name>[\w-]+)\1\s*\]', re.IGNORECASE),
+    # get_qicon('<name>'), e.g. tabler_icon.get_qicon('refresh')
+    re.compile(r'\bget_qicon\(\s*([\'"])(?P<name>[\w-]+)\1'),
+]
+
+# Directory names skipped when scanning directories, in addition to hidden directories and virtual environments
+EXCLUDED_DIRECTORY_NAMES = ('__pycache__', 'site-packages', 'dist-packages', 'node_modules', 'build', 'dist')
+
+# Fixed timestamp of the archive members, making the bundles reproducible
+BUNDLE_MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+# Functions Definition
+# --------------------
+def find_icon_names(paths: Iterable[Union[str, Path]],
+                    file_extensions: Iterable[str] = ('.py', ),
+                    source_directory: Union[str, Path] = TABLER_ICONS_SVG_DIRECTORY,
+                    excluded_directory_names: Iterable[str] = EXCLUDED_DIRECTORY_NAMES) -> Set[str]:
+    """Scans source files for icon usages and returns the names of the icons used.
+
+    Icon usages are matched against `ICON_USAGE_PATTERNS`. Python files are also parsed to find
+    the usages of TablerQIcon instances, e.g. `tabler_icon.refresh`, `tabler_icon.flip.player_play`
+    or `tabler_icon('settings')`. The names bound to instances are collected from all the scanned files
+    first, so instances created in one module and used in another are detected as well.
+    Only the names of icons that exist in the source directory are returned.
+
+    Args:
+        paths (Iterable[Union[str, Path]]): The source files or directories to scan. Directories are scanned recursively.
+        file_extensions (Iterable[str], optional): The extensions of the files to scan in directories. Defaults to ('.py', ).
+        source_directory (Union[str, Path], optional): The directory containing the available SVG icons.
+            Defaults to the packaged icons directory.
+        excluded_directory_names (Iterable[str], optional): Names or glob patterns of the directories to skip when
+            scanning directories. Hidden directories and virtual environments are always skipped.
+            Defaults to EXCLUDED_DIRECTORY_NAMES.
+
+    Returns:
+        Set[str]: The names of the icons used in the source files.
+    """
+    # Retrieve the names of all available icons
+    available_icon_names = set(scan_icon_directory(source_directory))
+    file_extensions = tuple(file_extensions)
+
+    names = set()
+    trees = list()
+
+    for file_path in _iter_source_files(paths, file_extensions, tuple(excluded_directory_names)):
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as source_file:
+            source = source_file.read()
+
+        for pattern in ICON_USAGE_PATTERNS:
+            names.update(match.group('name') for match in pattern.finditer(source))
+
+        if file_path.suffix == '.py':
+            try:
+                trees.append(ast.parse(source))
+            except (SyntaxError, ValueError):
+                continue
+
+    # Find the usages of the instances across all the parsed files
+    names.update(_find_instance_icon_names(trees))
+
+    # Keep only the names of existing icons, dropping method names, unrelated subscripts and invalid names
+    icon_names = set()
+    for name in names:
+        try:
+            icon_names.add(to_icon_name(name))
+        except ValueError:
+            continue
+
+    return icon_names & available_icon_names
+
+
+def read_allowlist(allowlist_path: Union[str, Path]) -> List[str]:
+    """Reads icon names from an allowlist file, one name per line.
+
+    Empty lines and lines starting with '#' are ignored.
+
+    Args:
+        allowlist_path (Union[str, Path]): The path of the allowlist file.
+
+    Returns:
+        List[str]: The icon names listed in the file.
+    """
+    with open(allowlist_path, 'r', encoding='utf-8') as allowlist_file:
+        lines = [line.strip() for line in allowlist_file]
+
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+def build_bundle(icon_names: Iterable[str],
+                 output_path: Union[str, Path],
+                 source_directory: Union[str, Path] = TABLER_ICONS_SVG_DIRECTORY) -> Path:
+    """Builds an icon bundle containing only the specified icons.
+
+    The bundle is a zip archive containing the SVG files of the icons and an index file mapping
+    the icon names to their SVG files. It can be used by TablerQIcon through `use_icon_bundle`.
+
+    Args:
+        icon_names (Iterable[str]): The names of the icons to include. Hyphenated names are accepted.
+        output_path (Union[str, Path]): The path of the bundle to write.
+        source_directory (Union[str, Path], optional): The directory containing the SVG icons.
+            Defaults to the packaged icons directory.
+
+    Returns:
+        Path: The path of the written bundle.
+
+    Raises:
+        ValueError: If any of the icon names doesn't match an icon in the source directory.
+    """
+    # Retrieve the dictionary mapping all available icon names to their paths
+    icon_name_to_path_dict = scan_icon_directory(source_directory)
+
+    # Sort the icon names to keep the bundle content reproducible
+    icon_names = sorted({to_icon_name(icon_name) for icon_name in icon_names})
+
+    # Ensure that all requested icons exist before writing anything
+    unknown_icon_names = [icon_name for icon_name in icon_names if icon_name not in icon_name_to_path_dict]
+    if unknown_icon_names:
+        raise ValueError(f"Unknown icon names: {', '.join(unknown_icon_names)}")
+
+    # Map each icon name to the SVG file name used as the archive member
+    index: Dict[str, str] = {icon_name: icon_name_to_path_dict[icon_name].name for icon_name in icon_names}
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+        _write_member(bundle, BUNDLE_INDEX_FILE_NAME, json.dumps(index, indent=0, sort_keys=True).encode('utf-8'))
+        for icon_name, member_name in index.items():
+            _write_member(bundle, member_name, icon_name_to_path_dict[icon_name].read_bytes())
+
+    return output_path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point to build an icon bundle from the icons used in source files.
+
+    Args:
+        argv (List[str], optional): The command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m tablerqicon.bundle',
+        description='Build an icon bundle containing only the Tabler icons used by an application.')
+    parser.add_argument('paths', nargs='*', help='Source files or directories to scan for icon usages.')
+    parser.add_argument('-o', '--output', required=True, help='Path of the icon bundle to write.')
+    parser.add_argument('-i', '--icon', action='append', default=[], help='Icon name to include explicitly. Repeatable.')
+    parser.add_argument('-a', '--allowlist', action='append', default=[],
+                        help='File listing icon names to include, one per line. Repeatable.')
+    parser.add_argument('-e', '--extension', action='append', dest='extensions',
+                        help="Extension of the source files to scan. Repeatable. Defaults to '.py'.")
+    parser.add_argument('-x', '--exclude', action='append', default=[],
+                        help='Name or glob pattern of the directories to skip, in addition to hidden directories, '
+                        f"virtual environments and {', '.join(EXCLUDED_DIRECTORY_NAMES)}. Repeatable.")
+    args = parser.parse_args(argv)
+
+    # Ensure that all source paths exist, a typo would otherwise silently produce an incomplete bundle
+    missing_paths = [path for path in args.paths if not os.path.exists(path)]
+    if missing_paths:
+        parser.error(f"Source paths do not exist: {', '.join(missing_paths)}")
+
+    # Collect the icon names used in the sources and listed explicitly
+    icon_names = find_icon_names(args.paths, args.extensions or ('.py', ),
+                                 excluded_directory_names=EXCLUDED_DIRECTORY_NAMES + tuple(args.exclude))
+    explicit_icon_names = list(args.icon)
+    for allowlist_path in args.allowlist:
+        explicit_icon_names.extend(read_allowlist(allowlist_path))
+
+    try:
+        icon_names.update(map(to_icon_name, explicit_icon_names))
+    except ValueError as error:
+        parser.error(str(error))
+
+    if not icon_names:
+        parser.error('No icons found in the source paths, explicit icon names or allowlists')
+
+    try:
+        output_path = build_bundle(icon_names, args.output)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f'{output_path}: {len(icon_names)} icons bundled')
+    return 0
+
+
+# Private Functions
+# -----------------
+def _iter_source_files(paths: Iterable[Union[str, Path]], file_extensions: tuple,
+                       excluded_directory_names: tuple) -> Iterable[Path]:
+    """Yields the source files to scan, walking directories recursively.
+
+    Hidden directories, virtual environments and the excluded directories are not walked into.
+
+    Args:
+        paths (Iterable[Union[str, Path]]): The source files or directories.
+        file_extensions (tuple): The extensions of the files to yield from directories.
+        excluded_directory_names (tuple): Names or glob patterns of the directories to skip.
+
+    Yields:
+        Path: The path of each source file.
+    """
+    for path in map(Path, paths):
+        if path.is_file():
+            yield path
+            continue
+
+        for root, dir_names, file_names in os.walk(path):
+            # Prune the skipped directories in place, so that os.walk doesn't walk into them
+            dir_names[:] = sorted(dir_name for dir_name in dir_names
+                                  if not _is_excluded_directory(Path(root) / dir_name, excluded_directory_names))
+
+            for file_name in sorted(file_names):
+                if file_name.endswith(file_extensions):
+                    yield Path(root) / file_name
+
+
+def _is_excluded_directory(directory: Path, excluded_directory_names: tuple) -> bool:
+    """Checks whether a directory is skipped when scanning for source files.
+
+    Args:
+        directory (Path): The directory.
+        excluded_directory_names (tuple): Names or glob patterns of the directories to skip.
+
+    Returns:
+        bool: True if the directory is hidden, is a virtual environment or matches an excluded name.
+    """
+    if directory.name.startswith('.'):
+        return True
+
+    # Virtual environments contain a 'pyvenv.cfg' file, whatever their name is
+    if (directory / 'pyvenv.cfg').is_file():
+        return True
+
+    return any(fnmatch.fnmatch(directory.name, pattern) for pattern in excluded_directory_names)
+
+
+def _find_instance_icon_names(trees: List[ast.Module]) -> Set[str]:
+    """Finds the names of the icons retrieved from TablerQIcon instances in parsed Python modules.
+
+    The names bound to `TablerQIcon(...)` are collected from all the modules first: by assignment, including
+    module-level names and `self.<attr>` attributes, by annotation, and by import from another module. Then
+    attribute accesses on them, including through the flip and flop properties, and calls and subscripts with
+    a string argument, are detected as icon usages in all the modules. Direct `TablerQIcon(...)` calls are
+    detected as well.
+
+    Names are matched by their last part, so an instance bound to `self.tabler_icon` in a base class is also
+    detected when used as `self.tabler_icon` in a subclass, and `icons_mod.tabler_icon` matches a module-level
+    `tabler_icon` in `icons_mod`.
+
+    Args:
+        trees (List[ast.Module]): The parsed Python modules.
+
+    Returns:
+        Set[str]: The names found, not filtered against the available icons.
+    """
+    # Collect the names referring to the TablerQIcon class, including import aliases
+    class_names = {ICON_CLASS_NAME}
+    for tree in trees:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom):
+                class_names.update(alias.asname for alias in node.names if alias.name == ICON_CLASS_NAME and alias.asname)
+
+    def is_class(node: ast.AST) -> bool:
+        dotted_name = _get_dotted_name(node)
+        return dotted_name is not None and dotted_name.split('.')[-1] in class_names
+
+    # Collect the last part of the names bound to TablerQIcon instances, e.g. 'tabler_icon' for 'self.tabler_icon'
+    instance_names = set()
+    import_aliases = list()
+    for tree in trees:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call) and is_class(node.value.func):
+                instance_names.update(filter(None, map(_get_dotted_name, node.targets)))
+            elif isinstance(node, ast.AnnAssign) and is_class(node.annotation):
+                instance_names.add(_get_dotted_name(node.target))
+            elif isinstance(node, ast.arg) and node.annotation is not None and is_class(node.annotation):
+                instance_names.add(node.arg)
+            elif isinstance(node, ast.ImportFrom):
+                import_aliases.extend((alias.name, alias.asname) for alias in node.names if alias.asname)
+    instance_names = {instance_name.split('.')[-1] for instance_name in instance_names if instance_name}
+
+    # Add the aliases of the instances imported from other modules, e.g. 'from icons_mod import tabler_icon as ti'
+    instance_names.update(asname for name, asname in import_aliases if name in instance_names)
+
+    def is_instance(node: ast.AST) -> bool:
+        if isinstance(node, ast.Call):
+            return is_class(node.func)
+        dotted_name = _get_dotted_name(node)
+        return dotted_name is not None and dotted_name.split('.')[-1] in instance_names
+
+    icon_names = set()
+
+    for tree in trees:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute) and node.attr not in TRANSFORMATION_PROPERTY_NAMES:
+                # Skip the flip and flop properties, which only exist on instances
+                base_node = node.value
+                is_transformed = False
+                while isinstance(base_node, ast.Attribute) and base_node.attr in TRANSFORMATION_PROPERTY_NAMES:
+                    base_node = base_node.value
+                    is_transformed = True
+
+                if is_instance(base_node) or (not is_transformed and is_class(base_node)):
+                    icon_names.add(node.attr)
+
+            elif isinstance(node, ast.Call) and node.args and is_instance(node.func):
+                icon_names.add(_get_string_value(node.args[0]))
+
+            elif isinstance(node, ast.Subscript) and is_instance(node.value):
+                icon_names.add(_get_string_value(node.slice))
+
+    icon_names.discard(None)
+    return icon_names
+
+
+def _get_dotted_name(node: ast.AST) -> Optional[str]:
+    """Gets the dotted name of a name or attribute node, e.g. 'self.tabler_icon'.
+
+    Args:
+        node (ast.AST): The node.
+
+    Returns:
+        Optional[str]: The dotted name, or None if the node is not a name or an attribute of a name.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        base_name = _get_dotted_name(node.value)
+        return f'{base_name}.{node.attr}' if base_name else None
+
+    return None
+
+
+def _get_string_value(node: ast.AST) -> Optional[str]:
+    """Gets the value of a string literal node.
+
+    Args:
+        node (ast.AST): The node, which may be wrapped in an `ast.Index` on Python < 3.9.
+
+    Returns:
+        Optional[str]: The string value, or None if the node is not a string literal.
+    """
+    # Unwrap the subscript index and read the string literal without the deprecated `ast.Index` and `ast.Str` classes
+    if type(node).__name__ == 'Index':
+        node = node.value
+    if isinstance(node, ast.Constant):
+        return node.value if isinstance(node.value, str) else None
+    if type(node).__name__ == 'Str':
+        return node.s
+
+    return None
+
+
+def _write_member(bundle: zipfile.ZipFile, member_name: str, data: bytes) -> None:
+    """Writes a member to the bundle archive with a fixed timestamp.
+
+    Args:
+        bundle (zipfile.ZipFile): The bundle archive opened for writing.
+        member_name (str): The name of the member.
+        data (bytes): The content of the member.
+    """
+    zip_info = zipfile.ZipInfo(member_name, date_time=BUNDLE_MEMBER_DATE_TIME)
+    zip_info.compress_type = zipfile.ZIP_DEFLATED
+    bundle.writestr(zip_info, data)
+
+
+# Main Execution
+# --------------
+if __name__ == '__main__':
+    sys.exit(main())
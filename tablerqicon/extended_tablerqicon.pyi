@@ -1,7 +1,7 @@
 '''
 extended_tablerqicon.pyi
 --------------------------------------------------------------------------------
-This file is generated by the `sync_tabler_icons.sh` script.
+This file is generated by the `sync_tabler_icons.py` script.
 --------------------------------------------------------------------------------
 NOTE: DO NOT EDIT THIS FILE DIRECTLY.
 --------------------------------------------------------------------------------
@@ -15,7 +15,7 @@ local directory `tablerqicon/icons` as SVG files.
 Each SVG file in this directory is reflected as an attribute in this file
 that returns a QIcon object.
 
-The `sync_tabler_icons.sh` script updates this file whenever the script is run,
+The `sync_tabler_icons.py` script updates this file whenever the script is run,
 to reflect any changes in the Tabler Icons repository.
 --------------------------------------------------------------------------------
 '''
@@ -34,17 +34,18 @@ class ExtendedTablerQIcon(TablerQIcon):
     _3d_cube_sphere: QIcon
     _3d_cube_sphere_off: QIcon
     _3d_rotate: QIcon
+    _lambda: QIcon
     a_b: QIcon
     a_b_2: QIcon
+    a_b_off: QIcon
     abacus: QIcon
     abacus_off: QIcon
     abc: QIcon
-    a_b_off: QIcon
+    access_point: QIcon
+    access_point_off: QIcon
     accessible: QIcon
     accessible_off: QIcon
     accessible_off_filled: QIcon
-    access_point: QIcon
-    access_point_off: QIcon
     activity: QIcon
     activity_heartbeat: QIcon
     ad: QIcon
@@ -52,9 +53,10 @@ class ExtendedTablerQIcon(TablerQIcon):
     ad_circle: QIcon
     ad_circle_filled: QIcon
     ad_circle_off: QIcon
+    ad_filled: QIcon
+    ad_off: QIcon
     address_book: QIcon
     address_book_off: QIcon
-    ad_filled: QIcon
     adjustments: QIcon
     adjustments_alt: QIcon
     adjustments_bolt: QIcon
@@ -79,7 +81,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     adjustments_star: QIcon
     adjustments_up: QIcon
     adjustments_x: QIcon
-    ad_off: QIcon
     aerial_lift: QIcon
     affiliate: QIcon
     affiliate_filled: QIcon
@@ -182,12 +183,12 @@ class ExtendedTablerQIcon(TablerQIcon):
     api_app: QIcon
     api_app_off: QIcon
     api_off: QIcon
+    app_window: QIcon
+    app_window_filled: QIcon
     apple: QIcon
     apps: QIcon
     apps_filled: QIcon
     apps_off: QIcon
-    app_window: QIcon
-    app_window_filled: QIcon
     archery_arrow: QIcon
     archive: QIcon
     archive_filled: QIcon
@@ -320,6 +321,23 @@ class ExtendedTablerQIcon(TablerQIcon):
     arrow_rotary_straight: QIcon
     arrow_roundabout_left: QIcon
     arrow_roundabout_right: QIcon
+    arrow_sharp_turn_left: QIcon
+    arrow_sharp_turn_right: QIcon
+    arrow_up: QIcon
+    arrow_up_bar: QIcon
+    arrow_up_circle: QIcon
+    arrow_up_left: QIcon
+    arrow_up_left_circle: QIcon
+    arrow_up_rhombus: QIcon
+    arrow_up_right: QIcon
+    arrow_up_right_circle: QIcon
+    arrow_up_square: QIcon
+    arrow_up_tail: QIcon
+    arrow_wave_left_down: QIcon
+    arrow_wave_left_up: QIcon
+    arrow_wave_right_down: QIcon
+    arrow_wave_right_up: QIcon
+    arrow_zig_zag: QIcon
     arrows_cross: QIcon
     arrows_diagonal: QIcon
     arrows_diagonal_2: QIcon
@@ -334,8 +352,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     arrows_down_up: QIcon
     arrows_exchange: QIcon
     arrows_exchange_2: QIcon
-    arrow_sharp_turn_left: QIcon
-    arrow_sharp_turn_right: QIcon
     arrows_horizontal: QIcon
     arrows_join: QIcon
     arrows_join_2: QIcon
@@ -363,21 +379,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     arrows_up_left: QIcon
     arrows_up_right: QIcon
     arrows_vertical: QIcon
-    arrow_up: QIcon
-    arrow_up_bar: QIcon
-    arrow_up_circle: QIcon
-    arrow_up_left: QIcon
-    arrow_up_left_circle: QIcon
-    arrow_up_rhombus: QIcon
-    arrow_up_right: QIcon
-    arrow_up_right_circle: QIcon
-    arrow_up_square: QIcon
-    arrow_up_tail: QIcon
-    arrow_wave_left_down: QIcon
-    arrow_wave_left_up: QIcon
-    arrow_wave_right_down: QIcon
-    arrow_wave_right_up: QIcon
-    arrow_zig_zag: QIcon
     artboard: QIcon
     artboard_filled: QIcon
     artboard_off: QIcon
@@ -427,14 +428,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     badge_filled: QIcon
     badge_hd: QIcon
     badge_off: QIcon
-    badges: QIcon
     badge_sd: QIcon
-    badges_filled: QIcon
-    badges_off: QIcon
     badge_tm: QIcon
     badge_vo: QIcon
     badge_vr: QIcon
     badge_wc: QIcon
+    badges: QIcon
+    badges_filled: QIcon
+    badges_off: QIcon
     baguette: QIcon
     ball_american_football: QIcon
     ball_american_football_off: QIcon
@@ -443,14 +444,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     ball_bowling: QIcon
     ball_football: QIcon
     ball_football_off: QIcon
+    ball_tennis: QIcon
+    ball_volleyball: QIcon
     balloon: QIcon
     balloon_filled: QIcon
     balloon_off: QIcon
     ballpen: QIcon
     ballpen_filled: QIcon
     ballpen_off: QIcon
-    ball_tennis: QIcon
-    ball_volleyball: QIcon
     ban: QIcon
     bandage: QIcon
     bandage_filled: QIcon
@@ -590,6 +591,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     book_2: QIcon
     book_download: QIcon
     book_filled: QIcon
+    book_off: QIcon
+    book_upload: QIcon
     bookmark: QIcon
     bookmark_ai: QIcon
     bookmark_edit: QIcon
@@ -601,16 +604,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     bookmarks: QIcon
     bookmarks_filled: QIcon
     bookmarks_off: QIcon
-    book_off: QIcon
     books: QIcon
     books_off: QIcon
-    book_upload: QIcon
     border_all: QIcon
     border_bottom: QIcon
     border_corner_pill: QIcon
     border_corner_rounded: QIcon
-    border_corners: QIcon
     border_corner_square: QIcon
+    border_corners: QIcon
     border_horizontal: QIcon
     border_inner: QIcon
     border_left: QIcon
@@ -725,6 +726,7 @@ class ExtendedTablerQIcon(TablerQIcon):
     brand_bulma: QIcon
     brand_bumble: QIcon
     brand_bunpo: QIcon
+    brand_c_sharp: QIcon
     brand_cake: QIcon
     brand_cakephp: QIcon
     brand_campaignmonitor: QIcon
@@ -746,7 +748,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     brand_cpp: QIcon
     brand_craft: QIcon
     brand_crunchbase: QIcon
-    brand_c_sharp: QIcon
     brand_css3: QIcon
     brand_ctemplar: QIcon
     brand_cucumber: QIcon
@@ -891,8 +892,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     brand_ok_ru: QIcon
     brand_onedrive: QIcon
     brand_onlyfans: QIcon
-    brand_openai: QIcon
     brand_open_source: QIcon
+    brand_openai: QIcon
     brand_openvpn: QIcon
     brand_opera: QIcon
     brand_pagekit: QIcon
@@ -1023,10 +1024,10 @@ class ExtendedTablerQIcon(TablerQIcon):
     brand_wix: QIcon
     brand_wordpress: QIcon
     brand_x: QIcon
+    brand_x_filled: QIcon
     brand_xamarin: QIcon
     brand_xbox: QIcon
     brand_xdeep: QIcon
-    brand_x_filled: QIcon
     brand_xing: QIcon
     brand_yahoo: QIcon
     brand_yandex: QIcon
@@ -1104,9 +1105,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     bulldozer: QIcon
     burger: QIcon
     bus: QIcon
-    businessplan: QIcon
     bus_off: QIcon
     bus_stop: QIcon
+    businessplan: QIcon
     butterfly: QIcon
     cactus: QIcon
     cactus_filled: QIcon
@@ -1191,9 +1192,13 @@ class ExtendedTablerQIcon(TablerQIcon):
     capture_filled: QIcon
     capture_off: QIcon
     car: QIcon
-    caravan: QIcon
     car_crane: QIcon
     car_crash: QIcon
+    car_garage: QIcon
+    car_off: QIcon
+    car_suv: QIcon
+    car_turbine: QIcon
+    caravan: QIcon
     cardboards: QIcon
     cardboards_off: QIcon
     cards: QIcon
@@ -1210,15 +1215,12 @@ class ExtendedTablerQIcon(TablerQIcon):
     caret_up_down: QIcon
     caret_up_down_filled: QIcon
     caret_up_filled: QIcon
-    car_garage: QIcon
-    car_off: QIcon
     carousel_horizontal: QIcon
     carousel_horizontal_filled: QIcon
     carousel_vertical: QIcon
     carousel_vertical_filled: QIcon
     carrot: QIcon
     carrot_off: QIcon
-    car_suv: QIcon
     cart_bolt: QIcon
     cart_cancel: QIcon
     cart_check: QIcon
@@ -1239,7 +1241,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     cart_share: QIcon
     cart_star: QIcon
     cart_up: QIcon
-    car_turbine: QIcon
     cart_x: QIcon
     cash: QIcon
     cash_banknote: QIcon
@@ -1254,6 +1255,7 @@ class ExtendedTablerQIcon(TablerQIcon):
     category_minus: QIcon
     category_plus: QIcon
     ce: QIcon
+    ce_off: QIcon
     cell: QIcon
     cell_signal_1: QIcon
     cell_signal_2: QIcon
@@ -1261,7 +1263,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     cell_signal_4: QIcon
     cell_signal_5: QIcon
     cell_signal_off: QIcon
-    ce_off: QIcon
     certificate: QIcon
     certificate_2: QIcon
     certificate_2_off: QIcon
@@ -1342,6 +1343,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     chevron_left_pipe: QIcon
     chevron_right: QIcon
     chevron_right_pipe: QIcon
+    chevron_up: QIcon
+    chevron_up_left: QIcon
+    chevron_up_right: QIcon
     chevrons_down: QIcon
     chevrons_down_left: QIcon
     chevrons_down_right: QIcon
@@ -1350,9 +1354,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     chevrons_up: QIcon
     chevrons_up_left: QIcon
     chevrons_up_right: QIcon
-    chevron_up: QIcon
-    chevron_up_left: QIcon
-    chevron_up_right: QIcon
     chisel: QIcon
     christmas_ball: QIcon
     christmas_tree: QIcon
@@ -1393,11 +1394,11 @@ class ExtendedTablerQIcon(TablerQIcon):
     circle_chevron_down: QIcon
     circle_chevron_left: QIcon
     circle_chevron_right: QIcon
+    circle_chevron_up: QIcon
     circle_chevrons_down: QIcon
     circle_chevrons_left: QIcon
     circle_chevrons_right: QIcon
     circle_chevrons_up: QIcon
-    circle_chevron_up: QIcon
     circle_dashed: QIcon
     circle_dashed_number_0: QIcon
     circle_dashed_number_1: QIcon
@@ -1462,13 +1463,13 @@ class ExtendedTablerQIcon(TablerQIcon):
     circle_plus_2: QIcon
     circle_rectangle: QIcon
     circle_rectangle_off: QIcon
-    circles: QIcon
-    circles_filled: QIcon
     circle_square: QIcon
-    circles_relation: QIcon
     circle_triangle: QIcon
     circle_x: QIcon
     circle_x_filled: QIcon
+    circles: QIcon
+    circles_filled: QIcon
+    circles_relation: QIcon
     circuit_ammeter: QIcon
     circuit_battery: QIcon
     circuit_bulb: QIcon
@@ -1607,13 +1608,13 @@ class ExtendedTablerQIcon(TablerQIcon):
     coin_pound_filled: QIcon
     coin_rupee: QIcon
     coin_rupee_filled: QIcon
-    coins: QIcon
     coin_taka: QIcon
     coin_taka_filled: QIcon
     coin_yen: QIcon
     coin_yen_filled: QIcon
     coin_yuan: QIcon
     coin_yuan_filled: QIcon
+    coins: QIcon
     color_filter: QIcon
     color_picker: QIcon
     color_picker_off: QIcon
@@ -1654,16 +1655,16 @@ class ExtendedTablerQIcon(TablerQIcon):
     cookie_off: QIcon
     copy: QIcon
     copy_check: QIcon
-    copyleft: QIcon
-    copyleft_filled: QIcon
-    copyleft_off: QIcon
     copy_minus: QIcon
     copy_off: QIcon
     copy_plus: QIcon
+    copy_x: QIcon
+    copyleft: QIcon
+    copyleft_filled: QIcon
+    copyleft_off: QIcon
     copyright: QIcon
     copyright_filled: QIcon
     copyright_off: QIcon
-    copy_x: QIcon
     corner_down_left: QIcon
     corner_down_left_double: QIcon
     corner_down_right: QIcon
@@ -1699,8 +1700,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     credit_card_refund: QIcon
     cricket: QIcon
     crop: QIcon
-    crop_1_1: QIcon
     crop_16_9: QIcon
+    crop_1_1: QIcon
     crop_3_2: QIcon
     crop_5_4: QIcon
     crop_7_5: QIcon
@@ -1708,8 +1709,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     crop_portrait: QIcon
     cross: QIcon
     cross_filled: QIcon
-    crosshair: QIcon
     cross_off: QIcon
+    crosshair: QIcon
     crown: QIcon
     crown_off: QIcon
     crutches: QIcon
@@ -1861,8 +1862,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     device_desktop_up: QIcon
     device_desktop_x: QIcon
     device_floppy: QIcon
-    device_gamepad: QIcon
     device_game_pad: QIcon
+    device_gamepad: QIcon
     device_gamepad_2: QIcon
     device_gamepad_3: QIcon
     device_heart_monitor: QIcon
@@ -1963,37 +1964,13 @@ class ExtendedTablerQIcon(TablerQIcon):
     device_nintendo_off: QIcon
     device_projector: QIcon
     device_remote: QIcon
-    devices: QIcon
-    devices_2: QIcon
-    devices_bolt: QIcon
-    devices_cancel: QIcon
-    devices_check: QIcon
-    devices_code: QIcon
-    devices_cog: QIcon
     device_sd_card: QIcon
-    devices_dollar: QIcon
-    devices_down: QIcon
-    devices_exclamation: QIcon
-    devices_heart: QIcon
     device_sim: QIcon
     device_sim_1: QIcon
     device_sim_2: QIcon
     device_sim_3: QIcon
-    devices_minus: QIcon
-    devices_off: QIcon
-    devices_pause: QIcon
-    devices_pc: QIcon
-    devices_pc_off: QIcon
     device_speaker: QIcon
     device_speaker_off: QIcon
-    devices_pin: QIcon
-    devices_plus: QIcon
-    devices_question: QIcon
-    devices_search: QIcon
-    devices_share: QIcon
-    devices_star: QIcon
-    devices_up: QIcon
-    devices_x: QIcon
     device_tablet: QIcon
     device_tablet_bolt: QIcon
     device_tablet_cancel: QIcon
@@ -2044,6 +2021,30 @@ class ExtendedTablerQIcon(TablerQIcon):
     device_watch_stats_2: QIcon
     device_watch_up: QIcon
     device_watch_x: QIcon
+    devices: QIcon
+    devices_2: QIcon
+    devices_bolt: QIcon
+    devices_cancel: QIcon
+    devices_check: QIcon
+    devices_code: QIcon
+    devices_cog: QIcon
+    devices_dollar: QIcon
+    devices_down: QIcon
+    devices_exclamation: QIcon
+    devices_heart: QIcon
+    devices_minus: QIcon
+    devices_off: QIcon
+    devices_pause: QIcon
+    devices_pc: QIcon
+    devices_pc_off: QIcon
+    devices_pin: QIcon
+    devices_plus: QIcon
+    devices_question: QIcon
+    devices_search: QIcon
+    devices_share: QIcon
+    devices_star: QIcon
+    devices_up: QIcon
+    devices_x: QIcon
     diabolo: QIcon
     diabolo_off: QIcon
     diabolo_plus: QIcon
@@ -2073,10 +2074,10 @@ class ExtendedTablerQIcon(TablerQIcon):
     direction: QIcon
     direction_arrows: QIcon
     direction_horizontal: QIcon
-    directions: QIcon
     direction_sign: QIcon
     direction_sign_filled: QIcon
     direction_sign_off: QIcon
+    directions: QIcon
     directions_off: QIcon
     disabled: QIcon
     disabled_2: QIcon
@@ -2134,13 +2135,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     droplet_pin: QIcon
     droplet_plus: QIcon
     droplet_question: QIcon
-    droplets: QIcon
     droplet_search: QIcon
     droplet_share: QIcon
     droplet_star: QIcon
     droplet_up: QIcon
     droplet_x: QIcon
+    droplets: QIcon
     dual_screen: QIcon
+    e_passport: QIcon
     ear: QIcon
     ear_off: QIcon
     ear_scan: QIcon
@@ -2168,7 +2170,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     emphasis: QIcon
     engine: QIcon
     engine_off: QIcon
-    e_passport: QIcon
     equal: QIcon
     equal_double: QIcon
     equal_not: QIcon
@@ -2208,9 +2209,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     eye_edit: QIcon
     eye_exclamation: QIcon
     eye_filled: QIcon
-    eyeglass: QIcon
-    eyeglass_2: QIcon
-    eyeglass_off: QIcon
     eye_heart: QIcon
     eye_minus: QIcon
     eye_off: QIcon
@@ -2224,6 +2222,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     eye_table: QIcon
     eye_up: QIcon
     eye_x: QIcon
+    eyeglass: QIcon
+    eyeglass_2: QIcon
+    eyeglass_off: QIcon
     face_id: QIcon
     face_id_error: QIcon
     face_mask: QIcon
@@ -2281,7 +2282,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     file_power: QIcon
     file_report: QIcon
     file_rss: QIcon
-    files: QIcon
     file_sad: QIcon
     file_scissors: QIcon
     file_search: QIcon
@@ -2289,7 +2289,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     file_shredder: QIcon
     file_signal: QIcon
     file_smile: QIcon
-    files_off: QIcon
     file_spreadsheet: QIcon
     file_stack: QIcon
     file_star: QIcon
@@ -2327,6 +2326,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     file_x: QIcon
     file_x_filled: QIcon
     file_zip: QIcon
+    files: QIcon
+    files_off: QIcon
     filter: QIcon
     filter_bolt: QIcon
     filter_cancel: QIcon
@@ -2346,12 +2347,12 @@ class ExtendedTablerQIcon(TablerQIcon):
     filter_pin: QIcon
     filter_plus: QIcon
     filter_question: QIcon
-    filters: QIcon
     filter_search: QIcon
     filter_share: QIcon
     filter_star: QIcon
     filter_up: QIcon
     filter_x: QIcon
+    filters: QIcon
     fingerprint: QIcon
     fingerprint_off: QIcon
     fingerprint_scan: QIcon
@@ -2419,6 +2420,7 @@ class ExtendedTablerQIcon(TablerQIcon):
     focus_centered: QIcon
     fold: QIcon
     fold_down: QIcon
+    fold_up: QIcon
     folder: QIcon
     folder_bolt: QIcon
     folder_cancel: QIcon
@@ -2438,15 +2440,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     folder_plus: QIcon
     folder_question: QIcon
     folder_root: QIcon
-    folders: QIcon
     folder_search: QIcon
     folder_share: QIcon
-    folders_off: QIcon
     folder_star: QIcon
     folder_symlink: QIcon
     folder_up: QIcon
     folder_x: QIcon
-    fold_up: QIcon
+    folders: QIcon
+    folders_off: QIcon
     forbid: QIcon
     forbid_2: QIcon
     forbid_2_filled: QIcon
@@ -2595,7 +2596,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     headset_off: QIcon
     health_recognition: QIcon
     heart: QIcon
-    heartbeat: QIcon
     heart_bolt: QIcon
     heart_broken: QIcon
     heart_cancel: QIcon
@@ -2615,13 +2615,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     heart_plus: QIcon
     heart_question: QIcon
     heart_rate_monitor: QIcon
-    hearts: QIcon
     heart_search: QIcon
     heart_share: QIcon
-    hearts_off: QIcon
     heart_star: QIcon
     heart_up: QIcon
     heart_x: QIcon
+    heartbeat: QIcon
+    hearts: QIcon
+    hearts_off: QIcon
     helicopter: QIcon
     helicopter_landing: QIcon
     helmet: QIcon
@@ -2648,20 +2649,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     hexagon_0_filled: QIcon
     hexagon_1_filled: QIcon
     hexagon_2_filled: QIcon
-    hexagon_3d: QIcon
     hexagon_3_filled: QIcon
+    hexagon_3d: QIcon
     hexagon_4_filled: QIcon
     hexagon_5_filled: QIcon
     hexagon_6_filled: QIcon
     hexagon_7_filled: QIcon
     hexagon_8_filled: QIcon
     hexagon_9_filled: QIcon
-    hexagonal_prism: QIcon
-    hexagonal_prism_off: QIcon
-    hexagonal_prism_plus: QIcon
-    hexagonal_pyramid: QIcon
-    hexagonal_pyramid_off: QIcon
-    hexagonal_pyramid_plus: QIcon
     hexagon_filled: QIcon
     hexagon_letter_a: QIcon
     hexagon_letter_b: QIcon
@@ -2704,6 +2699,12 @@ class ExtendedTablerQIcon(TablerQIcon):
     hexagon_off: QIcon
     hexagon_plus: QIcon
     hexagon_plus_2: QIcon
+    hexagonal_prism: QIcon
+    hexagonal_prism_off: QIcon
+    hexagonal_prism_plus: QIcon
+    hexagonal_pyramid: QIcon
+    hexagonal_pyramid_off: QIcon
+    hexagonal_pyramid_plus: QIcon
     hexagons: QIcon
     hexagons_off: QIcon
     hierarchy: QIcon
@@ -2746,8 +2747,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     home_up: QIcon
     home_x: QIcon
     horse: QIcon
-    horseshoe: QIcon
     horse_toy: QIcon
+    horseshoe: QIcon
     hospital: QIcon
     hospital_circle: QIcon
     hotel_service: QIcon
@@ -2840,6 +2841,7 @@ class ExtendedTablerQIcon(TablerQIcon):
     kayak: QIcon
     kering: QIcon
     key: QIcon
+    key_off: QIcon
     keyboard: QIcon
     keyboard_hide: QIcon
     keyboard_off: QIcon
@@ -2854,11 +2856,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     keyframe_filled: QIcon
     keyframes: QIcon
     keyframes_filled: QIcon
-    key_off: QIcon
     ladder: QIcon
     ladder_off: QIcon
     ladle: QIcon
-    _lambda: QIcon
     lamp: QIcon
     lamp_2: QIcon
     lamp_off: QIcon
@@ -2937,11 +2937,11 @@ class ExtendedTablerQIcon(TablerQIcon):
     letter_b: QIcon
     letter_b_small: QIcon
     letter_c: QIcon
+    letter_c_small: QIcon
     letter_case: QIcon
     letter_case_lower: QIcon
     letter_case_toggle: QIcon
     letter_case_upper: QIcon
-    letter_c_small: QIcon
     letter_d: QIcon
     letter_d_small: QIcon
     letter_e: QIcon
@@ -2973,8 +2973,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     letter_r: QIcon
     letter_r_small: QIcon
     letter_s: QIcon
-    letter_spacing: QIcon
     letter_s_small: QIcon
+    letter_spacing: QIcon
     letter_t: QIcon
     letter_t_small: QIcon
     letter_u: QIcon
@@ -3095,13 +3095,11 @@ class ExtendedTablerQIcon(TablerQIcon):
     macro: QIcon
     macro_off: QIcon
     magnet: QIcon
-    magnetic: QIcon
     magnet_off: QIcon
+    magnetic: QIcon
     mail: QIcon
     mail_ai: QIcon
     mail_bolt: QIcon
-    mailbox: QIcon
-    mailbox_off: QIcon
     mail_cancel: QIcon
     mail_check: QIcon
     mail_code: QIcon
@@ -3126,6 +3124,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     mail_star: QIcon
     mail_up: QIcon
     mail_x: QIcon
+    mailbox: QIcon
+    mailbox_off: QIcon
     man: QIcon
     manual_gearbox: QIcon
     map: QIcon
@@ -3163,12 +3163,12 @@ class ExtendedTablerQIcon(TablerQIcon):
     map_pin_pin: QIcon
     map_pin_plus: QIcon
     map_pin_question: QIcon
-    map_pins: QIcon
     map_pin_search: QIcon
     map_pin_share: QIcon
     map_pin_star: QIcon
     map_pin_up: QIcon
     map_pin_x: QIcon
+    map_pins: QIcon
     map_plus: QIcon
     map_question: QIcon
     map_route: QIcon
@@ -3202,8 +3202,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     math_function_y: QIcon
     math_greater: QIcon
     math_integral: QIcon
-    math_integrals: QIcon
     math_integral_x: QIcon
+    math_integrals: QIcon
     math_lower: QIcon
     math_max: QIcon
     math_min: QIcon
@@ -3306,13 +3306,13 @@ class ExtendedTablerQIcon(TablerQIcon):
     message_question: QIcon
     message_reply: QIcon
     message_report: QIcon
-    messages: QIcon
     message_search: QIcon
     message_share: QIcon
-    messages_off: QIcon
     message_star: QIcon
     message_up: QIcon
     message_x: QIcon
+    messages: QIcon
+    messages_off: QIcon
     meteor: QIcon
     meteor_off: QIcon
     metronome: QIcon
@@ -3478,8 +3478,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     needle_thread: QIcon
     network: QIcon
     network_off: QIcon
-    news: QIcon
     new_section: QIcon
+    news: QIcon
     news_off: QIcon
     nfc: QIcon
     nfc_off: QIcon
@@ -3488,9 +3488,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     no_derivatives: QIcon
     north_star: QIcon
     note: QIcon
+    note_off: QIcon
     notebook: QIcon
     notebook_off: QIcon
-    note_off: QIcon
     notes: QIcon
     notes_off: QIcon
     notification: QIcon
@@ -3709,8 +3709,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     pin: QIcon
     pin_end: QIcon
     pin_filled: QIcon
-    ping_pong: QIcon
     pin_invoke: QIcon
+    ping_pong: QIcon
     pinned: QIcon
     pinned_filled: QIcon
     pinned_off: QIcon
@@ -3722,8 +3722,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     plane_departure: QIcon
     plane_inflight: QIcon
     plane_off: QIcon
-    planet: QIcon
     plane_tilt: QIcon
+    planet: QIcon
     planet_off: QIcon
     plant: QIcon
     plant_2: QIcon
@@ -3732,6 +3732,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     play_basketball: QIcon
     play_card: QIcon
     play_card_off: QIcon
+    play_football: QIcon
+    play_handball: QIcon
+    play_volleyball: QIcon
     player_eject: QIcon
     player_eject_filled: QIcon
     player_pause: QIcon
@@ -3750,8 +3753,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     player_track_next_filled: QIcon
     player_track_prev: QIcon
     player_track_prev_filled: QIcon
-    play_football: QIcon
-    play_handball: QIcon
     playlist: QIcon
     playlist_add: QIcon
     playlist_off: QIcon
@@ -3760,7 +3761,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     playstation_square: QIcon
     playstation_triangle: QIcon
     playstation_x: QIcon
-    play_volleyball: QIcon
     plug: QIcon
     plug_connected: QIcon
     plug_connected_x: QIcon
@@ -3773,6 +3773,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     podium: QIcon
     podium_off: QIcon
     point: QIcon
+    point_filled: QIcon
+    point_off: QIcon
     pointer: QIcon
     pointer_bolt: QIcon
     pointer_cancel: QIcon
@@ -3795,8 +3797,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     pointer_star: QIcon
     pointer_up: QIcon
     pointer_x: QIcon
-    point_filled: QIcon
-    point_off: QIcon
     pokeball: QIcon
     pokeball_off: QIcon
     poker_chip: QIcon
@@ -3848,10 +3848,10 @@ class ExtendedTablerQIcon(TablerQIcon):
     radar_2: QIcon
     radar_off: QIcon
     radio: QIcon
+    radio_off: QIcon
     radioactive: QIcon
     radioactive_filled: QIcon
     radioactive_off: QIcon
-    radio_off: QIcon
     radius_bottom_left: QIcon
     radius_bottom_right: QIcon
     radius_top_left: QIcon
@@ -3945,9 +3945,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     robot_off: QIcon
     rocket: QIcon
     rocket_off: QIcon
+    roller_skating: QIcon
     rollercoaster: QIcon
     rollercoaster_off: QIcon
-    roller_skating: QIcon
     rosette: QIcon
     rosette_filled: QIcon
     rosette_number_0: QIcon
@@ -3972,13 +3972,13 @@ class ExtendedTablerQIcon(TablerQIcon):
     route_alt_left: QIcon
     route_alt_right: QIcon
     route_off: QIcon
-    router: QIcon
-    router_off: QIcon
     route_scan: QIcon
     route_square: QIcon
     route_square_2: QIcon
     route_x: QIcon
     route_x_2: QIcon
+    router: QIcon
+    router_off: QIcon
     row_insert_bottom: QIcon
     row_insert_top: QIcon
     row_remove: QIcon
@@ -3993,6 +3993,10 @@ class ExtendedTablerQIcon(TablerQIcon):
     ruler_off: QIcon
     run: QIcon
     rv_truck: QIcon
+    s_turn_down: QIcon
+    s_turn_left: QIcon
+    s_turn_right: QIcon
+    s_turn_up: QIcon
     sailboat: QIcon
     sailboat_2: QIcon
     sailboat_off: QIcon
@@ -4087,13 +4091,14 @@ class ExtendedTablerQIcon(TablerQIcon):
     share_2: QIcon
     share_3: QIcon
     share_off: QIcon
+    shi_jumping: QIcon
     shield: QIcon
     shield_bolt: QIcon
     shield_cancel: QIcon
     shield_check: QIcon
+    shield_check_filled: QIcon
     shield_checkered: QIcon
     shield_checkered_filled: QIcon
-    shield_check_filled: QIcon
     shield_chevron: QIcon
     shield_code: QIcon
     shield_cog: QIcon
@@ -4117,7 +4122,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     shield_star: QIcon
     shield_up: QIcon
     shield_x: QIcon
-    shi_jumping: QIcon
     ship: QIcon
     ship_off: QIcon
     shirt: QIcon
@@ -4162,6 +4166,10 @@ class ExtendedTablerQIcon(TablerQIcon):
     shovel: QIcon
     shovel_pitchforks: QIcon
     shredder: QIcon
+    sign_left: QIcon
+    sign_left_filled: QIcon
+    sign_right: QIcon
+    sign_right_filled: QIcon
     signal_2g: QIcon
     signal_3g: QIcon
     signal_4g: QIcon
@@ -4175,15 +4183,11 @@ class ExtendedTablerQIcon(TablerQIcon):
     signal_lte: QIcon
     signature: QIcon
     signature_off: QIcon
-    sign_left: QIcon
-    sign_left_filled: QIcon
-    sign_right: QIcon
-    sign_right_filled: QIcon
     sitemap: QIcon
     sitemap_off: QIcon
     skateboard: QIcon
-    skateboarding: QIcon
     skateboard_off: QIcon
+    skateboarding: QIcon
     skew_x: QIcon
     skew_y: QIcon
     skull: QIcon
@@ -4211,11 +4215,11 @@ class ExtendedTablerQIcon(TablerQIcon):
     solar_panel_2: QIcon
     sort_0_9: QIcon
     sort_9_0: QIcon
+    sort_a_z: QIcon
     sort_ascending: QIcon
     sort_ascending_2: QIcon
     sort_ascending_letters: QIcon
     sort_ascending_numbers: QIcon
-    sort_a_z: QIcon
     sort_descending: QIcon
     sort_descending_2: QIcon
     sort_descending_letters: QIcon
@@ -4274,6 +4278,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     square_chevron_left_filled: QIcon
     square_chevron_right: QIcon
     square_chevron_right_filled: QIcon
+    square_chevron_up: QIcon
+    square_chevron_up_filled: QIcon
     square_chevrons_down: QIcon
     square_chevrons_down_filled: QIcon
     square_chevrons_left: QIcon
@@ -4282,8 +4288,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     square_chevrons_right_filled: QIcon
     square_chevrons_up: QIcon
     square_chevrons_up_filled: QIcon
-    square_chevron_up: QIcon
-    square_chevron_up_filled: QIcon
     square_dot: QIcon
     square_dot_filled: QIcon
     square_f0: QIcon
@@ -4376,6 +4380,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     square_rounded_chevron_left_filled: QIcon
     square_rounded_chevron_right: QIcon
     square_rounded_chevron_right_filled: QIcon
+    square_rounded_chevron_up: QIcon
+    square_rounded_chevron_up_filled: QIcon
     square_rounded_chevrons_down: QIcon
     square_rounded_chevrons_down_filled: QIcon
     square_rounded_chevrons_left: QIcon
@@ -4384,8 +4390,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     square_rounded_chevrons_right_filled: QIcon
     square_rounded_chevrons_up: QIcon
     square_rounded_chevrons_up_filled: QIcon
-    square_rounded_chevron_up: QIcon
-    square_rounded_chevron_up_filled: QIcon
     square_rounded_filled: QIcon
     square_rounded_letter_a: QIcon
     square_rounded_letter_b: QIcon
@@ -4441,12 +4445,12 @@ class ExtendedTablerQIcon(TablerQIcon):
     square_rounded_plus_filled: QIcon
     square_rounded_x: QIcon
     square_rounded_x_filled: QIcon
-    squares_diagonal: QIcon
-    squares_filled: QIcon
     square_toggle: QIcon
     square_toggle_horizontal: QIcon
     square_x: QIcon
     square_x_filled: QIcon
+    squares_diagonal: QIcon
+    squares_filled: QIcon
     stack: QIcon
     stack_2: QIcon
     stack_3: QIcon
@@ -4484,10 +4488,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     stretching: QIcon
     stretching_2: QIcon
     strikethrough: QIcon
-    s_turn_down: QIcon
-    s_turn_left: QIcon
-    s_turn_right: QIcon
-    s_turn_up: QIcon
     submarine: QIcon
     subscript: QIcon
     subtask: QIcon
@@ -4496,15 +4496,15 @@ class ExtendedTablerQIcon(TablerQIcon):
     sun: QIcon
     sun_electricity: QIcon
     sun_filled: QIcon
-    sunglasses: QIcon
     sun_high: QIcon
     sun_low: QIcon
     sun_moon: QIcon
     sun_off: QIcon
+    sun_wind: QIcon
+    sunglasses: QIcon
     sunrise: QIcon
     sunset: QIcon
     sunset_2: QIcon
-    sun_wind: QIcon
     superscript: QIcon
     svg: QIcon
     swimming: QIcon
@@ -4538,9 +4538,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     table_shortcut: QIcon
     tag: QIcon
     tag_off: QIcon
+    tag_starred: QIcon
     tags: QIcon
     tags_off: QIcon
-    tag_starred: QIcon
     tallymark_1: QIcon
     tallymark_2: QIcon
     tallymark_3: QIcon
@@ -4583,9 +4583,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     text_scan_2: QIcon
     text_size: QIcon
     text_spellcheck: QIcon
-    texture: QIcon
     text_wrap: QIcon
     text_wrap_disabled: QIcon
+    texture: QIcon
     theater: QIcon
     thermometer: QIcon
     thumb_down: QIcon
@@ -4594,9 +4594,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     thumb_up: QIcon
     thumb_up_filled: QIcon
     thumb_up_off: QIcon
+    tic_tac: QIcon
     ticket: QIcon
     ticket_off: QIcon
-    tic_tac: QIcon
     tie: QIcon
     tilde: QIcon
     tilt_shift: QIcon
@@ -4699,9 +4699,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     triangle_off: QIcon
     triangle_plus: QIcon
     triangle_plus_2: QIcon
-    triangles: QIcon
     triangle_square_circle: QIcon
     triangle_square_circle_filled: QIcon
+    triangles: QIcon
     trident: QIcon
     trolley: QIcon
     trophy: QIcon
@@ -4748,19 +4748,19 @@ class ExtendedTablerQIcon(TablerQIcon):
     user_pin: QIcon
     user_plus: QIcon
     user_question: QIcon
-    users: QIcon
     user_scan: QIcon
     user_search: QIcon
-    users_group: QIcon
     user_share: QIcon
     user_shield: QIcon
-    users_minus: QIcon
-    users_plus: QIcon
     user_square: QIcon
     user_square_rounded: QIcon
     user_star: QIcon
     user_up: QIcon
     user_x: QIcon
+    users: QIcon
+    users_group: QIcon
+    users_minus: QIcon
+    users_plus: QIcon
     uv_index: QIcon
     ux_circle: QIcon
     vaccine: QIcon
@@ -4811,9 +4811,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     vs: QIcon
     walk: QIcon
     wall: QIcon
+    wall_off: QIcon
     wallet: QIcon
     wallet_off: QIcon
-    wall_off: QIcon
     wallpaper: QIcon
     wallpaper_off: QIcon
     wand: QIcon
@@ -4824,8 +4824,6 @@ class ExtendedTablerQIcon(TablerQIcon):
     wash_dry_2: QIcon
     wash_dry_3: QIcon
     wash_dry_a: QIcon
-    wash_dryclean: QIcon
-    wash_dryclean_off: QIcon
     wash_dry_dip: QIcon
     wash_dry_f: QIcon
     wash_dry_flat: QIcon
@@ -4834,6 +4832,8 @@ class ExtendedTablerQIcon(TablerQIcon):
     wash_dry_p: QIcon
     wash_dry_shade: QIcon
     wash_dry_w: QIcon
+    wash_dryclean: QIcon
+    wash_dryclean_off: QIcon
     wash_eco: QIcon
     wash_gentle: QIcon
     wash_hand: QIcon
@@ -4850,9 +4850,9 @@ class ExtendedTablerQIcon(TablerQIcon):
     wash_tumble_off: QIcon
     waterpolo: QIcon
     wave_saw_tool: QIcon
-    waves_electricity: QIcon
     wave_sine: QIcon
     wave_square: QIcon
+    waves_electricity: QIcon
     webhook: QIcon
     webhook_off: QIcon
     weight: QIcon
@@ -4867,10 +4867,10 @@ class ExtendedTablerQIcon(TablerQIcon):
     wifi_off: QIcon
     wind: QIcon
     wind_electricity: QIcon
+    wind_off: QIcon
     windmill: QIcon
     windmill_filled: QIcon
     windmill_off: QIcon
-    wind_off: QIcon
     window: QIcon
     window_maximize: QIcon
     window_minimize: QIcon
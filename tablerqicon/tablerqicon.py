@@ -4,14 +4,16 @@ __version__ = '0.2.3'
 # ------------------------
 from functools import lru_cache
 import importlib
+import json
 import keyword
 import logging
 import os
 from pathlib import Path
 import re
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from xml.etree import ElementTree
+import zipfile
 
 # Related Third Party Imports
 # ---------------------------
@@ -93,6 +95,61 @@ use_backend()
 # Constants Definition
 # --------------------
 TABLER_ICONS_SVG_DIRECTORY = Path(__file__).parent / 'icons'
+# Name of the index file stored inside an icon bundle, mapping icon names to archive members
+BUNDLE_INDEX_FILE_NAME = 'index.json'
+
+# Compile the regex pattern once to avoid recompilation for each icon name
+INVALID_ICON_NAME_CHARS_PATTERN = re.compile(r'[\W_]+')
+
+
+# Functions Definition
+# --------------------
+def to_icon_name(file_name: str) -> str:
+    """Converts an SVG file name (or a hyphenated icon name) into a valid Python attribute name.
+
+    Args:
+        file_name (str): The SVG file name, e.g. 'arrow-left.svg' or 'arrow-left'.
+
+    Returns:
+        str: The sanitized icon name, e.g. 'arrow_left'.
+
+    Raises:
+        ValueError: If the name is empty, or empty once the extension is removed, e.g. '.svg'.
+    """
+    # Use regex to replace invalid characters with an underscore
+    icon_name = INVALID_ICON_NAME_CHARS_PATTERN.sub('_', file_name.split('.')[0])
+    if not icon_name:
+        raise ValueError(f'Cannot convert {file_name!r} into an icon name')
+    # Check if the icon name is a Python keyword or starts with a number
+    if keyword.iskeyword(icon_name) or icon_name[0].isdigit():
+        icon_name = "_" + icon_name
+
+    return icon_name
+
+
+def scan_icon_directory(directory: Union[str, Path] = TABLER_ICONS_SVG_DIRECTORY) -> Dict[str, Path]:
+    """Scans a directory and constructs a dictionary mapping sanitized SVG file names to their file paths.
+
+    Args:
+        directory (Union[str, Path], optional): The directory containing the SVG files.
+            Defaults to the packaged icons directory.
+
+    Returns:
+        Dict[str, Path]: containing the icon name as key and the icon path as value
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+    """
+    # Ensure the specified directory exists before proceeding
+    if not os.path.isdir(directory):
+        # If the directory does not exist, raise a FileNotFoundError with a descriptive message
+        raise FileNotFoundError(f"Directory {directory} does not exist")
+
+    # Get a list of all SVG files in the directory
+    svg_files = [file for file in os.listdir(directory) if file.endswith('.svg')]
+
+    # For each SVG file, sanitize the file name to create the icon name
+    return {to_icon_name(svg_file): Path(directory) / svg_file for svg_file in svg_files}
 
 
 # Classes Definition
@@ -108,11 +165,15 @@ class TablerQIconMeta(type):
     Attributes:
         _icon_name_to_path_dict: A shared class variable as an empty dictionary to
             store the icon name and path.
+        _icon_bundle: The opened icon bundle archive set by `use_icon_bundle`, or None
+            when icons are loaded from the packaged icons directory.
     """
     # Class Variables Definition
     # --------------------------
     # Create a shared class variable as an empty dictionary to store the icon name and path
     _icon_name_to_path_dict: Dict[str, str] = dict()
+    # Icon bundle archive to read the icons from instead of the icons directory
+    _icon_bundle: Optional[zipfile.ZipFile] = None
 
     # Special Methods
     # ---------------
@@ -156,46 +217,57 @@ class TablerQIconMeta(type):
         """Scans the predefined icon directory and constructs a dictionary mapping sanitized SVG file names
         to their respective file paths.
 
+        If an icon bundle is in use, the dictionary read from the bundle index is returned instead,
+        mapping the icon names to their member paths inside the bundle archive.
+
         Returns:
             Dict[str, str]: containing the icon name as key and the icon path as value
 
         Raises:
             FileNotFoundError: If the predefined directory does not exist.
         """
-        # If the class attribute _icon_name_to_path_dict is already populated, return it
-        if cls._icon_name_to_path_dict:
+        # If the class attribute _icon_name_to_path_dict is already populated or read from a bundle, return it
+        if cls._icon_name_to_path_dict or cls._icon_bundle is not None:
             return cls._icon_name_to_path_dict
 
-        # Ensure the specified directory exists before proceeding
-        if not os.path.isdir(TABLER_ICONS_SVG_DIRECTORY):
-            # If the directory does not exist, raise a FileNotFoundError with a descriptive message
-            raise FileNotFoundError(f"Directory {TABLER_ICONS_SVG_DIRECTORY} does not exist")
+        # Scan the packaged icons directory to create the icon name to path mapping
+        icon_name_to_path_dict = scan_icon_directory(TABLER_ICONS_SVG_DIRECTORY)
 
-        # Create an empty dictionary to store the icon name and path
-        icon_name_to_path_dict = dict()
+        # Store the constructed dictionary in the class attribute _icon_name_to_path_dict for future reference
+        cls._icon_name_to_path_dict = icon_name_to_path_dict
 
-        # Get a list of all SVG files in the TABLER_ICONS_SVG_DIRECTORY
-        svg_files = [file for file in os.listdir(TABLER_ICONS_SVG_DIRECTORY) if file.endswith('.svg')]
+        # Return the dictionary containing the icon name and path
+        return cls._icon_name_to_path_dict
 
-        # Compile the regex pattern once to avoid recompilation in each loop iteration
-        pattern = re.compile(r'[\W_]+')
+    @classmethod
+    def _read_svg_bytes(cls, name: str) -> Optional[bytes]:
+        """Reads the SVG content of the specified icon from the icon bundle or the icons directory.
 
-        # For each SVG file, sanitize the file name to create the icon name
-        for svg_file in svg_files:
-            # Use regex to replace invalid characters with an underscore
-            icon_name = pattern.sub('_', svg_file.split('.')[0])
-            # Check if the icon name is a Python keyword or starts with a number
-            if keyword.iskeyword(icon_name) or icon_name[0].isdigit():
-                icon_name = "_" + icon_name
+        Args:
+            name (str): The name of the icon to read.
 
-            # Add the icon name and path to the icon_name_to_path_dict
-            icon_name_to_path_dict[icon_name] = TABLER_ICONS_SVG_DIRECTORY / svg_file
+        Returns:
+            Optional[bytes]: The SVG content of the icon, or None if the icon is not available.
+        """
+        # Get the path of the icon from the dictionary using the name as the key
+        svg_icon_path = cls._get_icon_name_to_path_dict().get(name)
 
-        # Store the constructed dictionary in the class attribute _icon_name_to_path_dict for future reference
-        cls._icon_name_to_path_dict = icon_name_to_path_dict
+        if svg_icon_path is None:
+            return None
 
-        # Return the dictionary containing the icon name and path
-        return cls._icon_name_to_path_dict
+        # Read the icon from the bundle archive if a bundle is in use
+        if cls._icon_bundle is not None:
+            try:
+                return cls._icon_bundle.read(svg_icon_path)
+            except KeyError:
+                return None
+
+        # Check if the path obtained points to an existing file
+        if not os.path.isfile(svg_icon_path):
+            return None
+
+        with open(svg_icon_path, 'rb') as svg_file:
+            return svg_file.read()
 
     @classmethod
     def _get_qicon(cls,
@@ -209,8 +281,8 @@ class TablerQIconMeta(type):
                    flop: bool = False) -> QtGui.QIcon:
         """Retrieves the icon as a QIcon object.
 
-        Retrieves the path of the specified icon, checks if the path points to an
-        existing file, and if it does, loads and returns the icon.
+        Reads the SVG content of the specified icon from the icon bundle or the icons
+        directory, and if it is available, loads and returns the icon.
 
         Args:
             name (str): The name of the icon to retrieve.
@@ -231,26 +303,19 @@ class TablerQIconMeta(type):
             app_instance = QtWidgets.QApplication.instance()
             color = app_instance.palette().color(QtGui.QPalette.ColorRole.Text)
 
-        # Retrieve the dictionary mapping icon names to their paths
-        icon_name_to_path_dict = cls._get_icon_name_to_path_dict()
-
-        # Get the path of the icon from the dictionary using the name as the key
-        svg_icon_path = icon_name_to_path_dict.get(name, str())
+        # Read the SVG content of the icon
+        svg_icon_bytes = cls._read_svg_bytes(name)
 
-        # Check if the path obtained points to an existing file, if not log a warning and return an empty QIcon
-        if not os.path.isfile(svg_icon_path):
+        # Check if the icon is available, if not log a warning and return an empty QIcon
+        if svg_icon_bytes is None:
             # Log a warning if the requested icon is not available or not a valid file
             logging.warning(f'Icon "{name}" is not available or not a valid file.')
             # Return an empty QIcon object
             return QtGui.QIcon()
 
         if QtSvg:
-            # Load the original SVG file
-            with open(svg_icon_path, 'r') as svg_file:
-                svg_str = svg_file.read()
-
-            # Parse the SVG file as XML
-            svg = ElementTree.fromstring(svg_str)
+            # Parse the SVG content as XML
+            svg = ElementTree.fromstring(svg_icon_bytes)
             # Set the stroke width of the icon
             svg.set('stroke-width', str(stroke_width))
             svg_bytes = ElementTree.tostring(svg)
@@ -273,8 +338,9 @@ class TablerQIconMeta(type):
             renderer.render(painter)
 
         else:
-            # Load the SVG file as a QPixmap
-            pixmap = QtGui.QPixmap(str(svg_icon_path))
+            # Load the SVG content as a QPixmap
+            pixmap = QtGui.QPixmap()
+            pixmap.loadFromData(svg_icon_bytes)
 
             # Set the size of the pixmap
             pixmap = pixmap.scaled(size, size, QtCore.Qt.AspectRatioMode.KeepAspectRatio,
@@ -492,6 +558,9 @@ class TablerQIcon(metaclass=TablerQIconMeta):
     def get_icon_path(cls, name: str = None) -> Optional[str]:
         """Provides the path of a specific icon or the icons directory.
 
+        When an icon bundle is in use, the bundle path is returned instead of the icons directory,
+        and the path of an icon is its member path inside the bundle.
+
         Args:
             name (str, optional): The name of the icon. If not provided, the method will return the icons directory.
 
@@ -499,9 +568,10 @@ class TablerQIcon(metaclass=TablerQIconMeta):
             Optional[str]: Path of the icon if the name is provided and exists in the dictionary, else the icons directory.
                 If the name is provided but doesn't match any in the dictionary, returns None.
         """
-        # If no icon name is provided, return the directory of all icons
+        # If no icon name is provided, return the bundle in use or the directory of all icons
         if not name:
-            return TABLER_ICONS_SVG_DIRECTORY
+            icon_bundle = TablerQIconMeta._icon_bundle
+            return Path(icon_bundle.filename) if icon_bundle is not None else TABLER_ICONS_SVG_DIRECTORY
 
         # Retrieve the dictionary mapping from icon names to their paths
         icon_name_to_path_dict = cls._get_icon_name_to_path_dict()
@@ -522,6 +592,48 @@ class TablerQIcon(metaclass=TablerQIconMeta):
         return self._Proxy(self, flop=True)
 
 
+def use_icon_bundle(bundle_path: Optional[Union[str, Path]] = None) -> None:
+    """Sets the icon bundle that TablerQIcon loads the icons from.
+
+    An icon bundle is a zip archive built with `python -m tablerqicon.bundle`, containing only a subset
+    of the icons along with an index mapping the icon names to their SVG files. Using a bundle avoids
+    scanning the full icons directory when building the icon name index.
+
+    Args:
+        bundle_path (Union[str, Path], optional): The path of the icon bundle. If not provided, the icons
+            are loaded from the packaged icons directory again.
+
+    Raises:
+        ValueError: If the file is not a valid icon bundle.
+    """
+    # Close the previously used bundle, if any, and reset the icon name index
+    if TablerQIconMeta._icon_bundle is not None:
+        TablerQIconMeta._icon_bundle.close()
+    TablerQIconMeta._icon_bundle = None
+    TablerQIconMeta._icon_name_to_path_dict = dict()
+    # Clear the cached icons, since they may have been loaded from a different source
+    TablerQIcon.get_qicon.cache_clear()
+
+    # If no bundle path is provided, fall back to the packaged icons directory
+    if bundle_path is None:
+        return
+
+    try:
+        icon_bundle = zipfile.ZipFile(bundle_path)
+    except zipfile.BadZipFile as error:
+        raise ValueError(f'{bundle_path} is not a valid icon bundle') from error
+
+    # Read the icon name index stored in the bundle
+    try:
+        icon_name_to_path_dict = json.loads(icon_bundle.read(BUNDLE_INDEX_FILE_NAME).decode('utf-8'))
+    except KeyError as error:
+        icon_bundle.close()
+        raise ValueError(f'{bundle_path} is not a valid icon bundle, "{BUNDLE_INDEX_FILE_NAME}" is missing') from error
+
+    TablerQIconMeta._icon_bundle = icon_bundle
+    TablerQIconMeta._icon_name_to_path_dict = icon_name_to_path_dict
+
+
 # Main Execution
 # --------------
 if __name__ == '__main__':
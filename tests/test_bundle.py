@@ -0,0 +1,208 @@
+# Standard Library Imports
+# ------------------------
+import json
+import os
+import zipfile
+
+# Related Third Party Imports
+# ---------------------------
+import pytest
+from PyQt5 import QtGui, QtWidgets
+
+# Local Imports
+# -------------
+os.environ['QT_API'] = 'PyQt5'
+from tablerqicon import TablerQIcon, use_icon_bundle
+from tablerqicon.bundle import build_bundle, find_icon_names, main
+from tablerqicon.tablerqicon import BUNDLE_INDEX_FILE_NAME
+
+
+# Fixture Definition
+# ------------------
+@pytest.fixture(scope="class")
+def qt_application():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+
+
+@pytest.fixture
+def source_directory(tmp_path):
+    source_directory = tmp_path / 'app'
+    source_directory.mkdir()
+    (source_directory / 'main.py').write_text(
+        "button.setIcon(TablerQIcon.player_play)\n"
+        "names = TablerQIcon.get_icon_names()\n"
+        "icon = tabler_icon['arrow-left']\n"
+        "icon = tabler_icon.get_qicon('refresh')\n"
+        "value = data['users']\n")
+    (source_directory / 'widget.py').write_text(
+        "from tablerqicon import TablerQIcon as TQ\n"
+        "\n"
+        "class Widget:\n"
+        "    def __init__(self):\n"
+        "        self.tabler_icon = TQ(opacity=0.6)\n"
+        "        self.tabler_icon.text_wrap\n"
+        "        self.tabler_icon.flip.flop.player_stop\n"
+        "        self.tabler_icon('settings')\n"
+        "        TablerQIcon(size=16).search\n"
+        "        # Not an icon usage, flip is an instance property\n"
+        "        TablerQIcon.flip.zzz\n"
+        "\n"
+        "def build(icons: TablerQIcon):\n"
+        "    return icons.trash\n")
+    return source_directory
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    yield build_bundle(['users', 'arrow-left'], tmp_path / 'icons.zip')
+    # Restore the packaged icons directory for the other tests
+    use_icon_bundle()
+
+
+# Test Cases
+# ----------
+class TestBundle(object):
+    """Test case for building and using icon bundles.
+    """
+
+    def test_find_icon_names(self, source_directory):
+        """Test that icon usages are found and non-icon names are dropped.
+        """
+        icon_names = find_icon_names([source_directory])
+        assert icon_names == {
+            'player_play', 'arrow_left', 'refresh', 'text_wrap', 'player_stop', 'settings', 'search', 'trash'
+        }
+
+    def test_find_icon_names_across_files(self, tmp_path):
+        """Test that instances created in one module are detected when used in other modules.
+        """
+        (tmp_path / 'icons_mod.py').write_text(
+            "from tablerqicon import TablerQIcon\n"
+            "tabler_icon = TablerQIcon(opacity=0.6)\n"
+            "\n"
+            "class BaseWindow:\n"
+            "    def __init__(self):\n"
+            "        self.window_icon = TablerQIcon()\n")
+        (tmp_path / 'window.py').write_text(
+            "from icons_mod import BaseWindow, tabler_icon\n"
+            "from icons_mod import tabler_icon as ti\n"
+            "import icons_mod\n"
+            "button.setIcon(tabler_icon.refresh)\n"
+            "button.setIcon(ti.flip.player_play)\n"
+            "button.setIcon(icons_mod.tabler_icon('settings'))\n"
+            "\n"
+            "class Window(BaseWindow):\n"
+            "    def setup(self):\n"
+            "        self.window_icon.trash\n")
+
+        icon_names = find_icon_names([tmp_path])
+        assert icon_names == {'refresh', 'player_play', 'settings', 'trash'}
+
+    def test_find_icon_names_invalid_names(self, tmp_path):
+        """Test that names which cannot be converted into icon names are skipped.
+        """
+        (tmp_path / 'main.py').write_text(
+            "tabler_icon = TablerQIcon()\n"
+            "tabler_icon('')\n"
+            "tabler_icon('.x')\n"
+            "tabler_icon['users']\n")
+
+        assert find_icon_names([tmp_path]) == {'users'}
+
+    def test_find_icon_names_excluded_directories(self, tmp_path):
+        """Test that hidden directories, virtual environments and excluded directories are skipped.
+        """
+        source = "tabler_icon = TablerQIcon()\ntabler_icon.{}\n"
+        for directory_name, icon_name in (('app', 'users'), ('.git', 'zzz'), ('venv', 'trash'), ('site-packages', 'x'),
+                                          ('generated', 'refresh')):
+            (tmp_path / directory_name).mkdir()
+            (tmp_path / directory_name / 'main.py').write_text(source.format(icon_name))
+        (tmp_path / 'venv' / 'pyvenv.cfg').write_text('')
+
+        icon_names = find_icon_names([tmp_path], excluded_directory_names=('site-packages', 'gen*'))
+        assert icon_names == {'users'}
+
+    def test_build_bundle(self, bundle_path):
+        """Test the content of a built bundle.
+        """
+        with zipfile.ZipFile(bundle_path) as bundle:
+            index = json.loads(bundle.read(BUNDLE_INDEX_FILE_NAME))
+            assert index == {'arrow_left': 'arrow-left.svg', 'users': 'users.svg'}
+            assert sorted(bundle.namelist()) == sorted([BUNDLE_INDEX_FILE_NAME, 'arrow-left.svg', 'users.svg'])
+
+    def test_build_bundle_reproducible(self, tmp_path):
+        """Test that building the same bundle twice gives identical archives.
+        """
+        first_bundle_path = build_bundle(['users', 'refresh'], tmp_path / 'first.zip')
+        second_bundle_path = build_bundle(['refresh', 'users'], tmp_path / 'second.zip')
+        assert first_bundle_path.read_bytes() == second_bundle_path.read_bytes()
+
+    def test_build_bundle_unknown_icon(self, tmp_path):
+        """Test that unknown icon names are rejected.
+        """
+        with pytest.raises(ValueError):
+            build_bundle(['not_an_icon'], tmp_path / 'icons.zip')
+
+    def test_main(self, source_directory, tmp_path):
+        """Test the command line entry point with an explicit icon and an allowlist.
+        """
+        allowlist_path = tmp_path / 'allowlist.txt'
+        allowlist_path.write_text('# Icons used in the designer files\nzzz\n\n')
+        output_path = tmp_path / 'icons.zip'
+
+        assert main([str(source_directory), '-o', str(output_path), '-i', 'users', '-a', str(allowlist_path)]) == 0
+
+        with zipfile.ZipFile(output_path) as bundle:
+            index = json.loads(bundle.read(BUNDLE_INDEX_FILE_NAME))
+        assert set(index) == {
+            'player_play', 'arrow_left', 'refresh', 'text_wrap', 'player_stop', 'settings', 'search', 'trash', 'users', 'zzz'
+        }
+
+    def test_main_invalid_icon_name(self, source_directory, tmp_path):
+        """Test that an explicit icon name which cannot be converted into an icon name is rejected.
+        """
+        with pytest.raises(SystemExit):
+            main([str(source_directory), '-o', str(tmp_path / 'icons.zip'), '-i', ''])
+        assert not (tmp_path / 'icons.zip').exists()
+
+    def test_main_missing_path(self, tmp_path):
+        """Test that a missing source path is rejected.
+        """
+        with pytest.raises(SystemExit):
+            main([str(tmp_path / 'missing'), '-o', str(tmp_path / 'icons.zip')])
+        assert not (tmp_path / 'icons.zip').exists()
+
+    def test_main_no_icons(self, tmp_path):
+        """Test that a bundle without icons is rejected.
+        """
+        (tmp_path / 'main.py').write_text("print('no icons')\n")
+        with pytest.raises(SystemExit):
+            main([str(tmp_path / 'main.py'), '-o', str(tmp_path / 'icons.zip')])
+        assert not (tmp_path / 'icons.zip').exists()
+
+    def test_use_icon_bundle(self, qt_application, bundle_path):
+        """Test the icon retrieval from an icon bundle.
+        """
+        use_icon_bundle(bundle_path)
+        assert sorted(TablerQIcon.get_icon_names()) == ['arrow_left', 'users']
+        assert TablerQIcon.get_icon_path() == bundle_path
+        assert TablerQIcon.get_icon_path('users') == 'users.svg'
+        assert isinstance(TablerQIcon.users, QtGui.QIcon)
+        assert not TablerQIcon.users.isNull()
+        # Icons missing from the bundle are not available
+        assert TablerQIcon.zzz.isNull()
+
+        # Switch back to the packaged icons directory
+        use_icon_bundle()
+        assert not TablerQIcon.zzz.isNull()
+
+    def test_use_icon_bundle_invalid(self, tmp_path):
+        """Test that an invalid bundle is rejected.
+        """
+        invalid_bundle_path = tmp_path / 'invalid.zip'
+        with zipfile.ZipFile(invalid_bundle_path, 'w') as bundle:
+            bundle.writestr('users.svg', '<svg/>')
+
+        with pytest.raises(ValueError):
+            use_icon_bundle(invalid_bundle_path)
@@ -0,0 +1,122 @@
+# Standard Library Imports
+# ------------------------
+import json
+import subprocess
+
+# Related Third Party Imports
+# ---------------------------
+import pytest
+
+# Local Imports
+# -------------
+from sync_tabler_icons import (MANIFEST_FILE_NAME, STUBS_FILE_NAME, UPDATE_LOG_FILE_NAME, get_current_branch, hash_icons, main,
+                               sync)
+
+
+# Fixture Definition
+# ------------------
+@pytest.fixture
+def checkout_directory(tmp_path):
+    checkout_directory = tmp_path / 'tabler-icons'
+    (checkout_directory / 'icons').mkdir(parents=True)
+    (checkout_directory / 'icons' / 'arrow-left.svg').write_text('<svg id="arrow-left"/>')
+    (checkout_directory / 'icons' / 'users.svg').write_text('<svg id="users"/>')
+    (checkout_directory / 'icons' / '123.svg').write_text('<svg id="123"/>')
+    return checkout_directory
+
+
+@pytest.fixture
+def target_directory(tmp_path):
+    target_directory = tmp_path / 'tablerqicon'
+    (target_directory / 'icons').mkdir(parents=True)
+    (target_directory / 'icons' / 'users.svg').write_text('<svg id="users"/>')
+    (target_directory / 'icons' / '123.svg').write_text('<svg id="old-123"/>')
+    (target_directory / 'icons' / 'removed.svg').write_text('<svg id="removed"/>')
+    return target_directory
+
+
+# Test Cases
+# ----------
+class TestSyncTablerIcons(object):
+    """Test case for the sync_tabler_icons script.
+    """
+
+    def test_sync(self, checkout_directory, target_directory):
+        """Test that only added and changed icons are reported and copied.
+        """
+        result = sync(checkout_directory, 'repository', 'master', target_directory=target_directory)
+
+        assert result.added == ['arrow-left.svg']
+        assert result.changed == ['123.svg']
+        assert result.removed == []
+        assert result.unchanged == ['users.svg']
+        assert (target_directory / 'icons' / '123.svg').read_text() == '<svg id="123"/>'
+        # Icons that no longer exist upstream are kept unless pruning
+        assert (target_directory / 'icons' / 'removed.svg').is_file()
+        # The hashes kept in memory match the icons on disk
+        assert result.icon_hashes == hash_icons(target_directory / 'icons')
+        assert result.num_icons_before == 3
+
+        update_log = (target_directory / 'icons' / UPDATE_LOG_FILE_NAME).read_text()
+        assert 'icons_before: 3\n' in update_log
+        assert 'icons_after: 4\n' in update_log
+
+    def test_sync_prune(self, checkout_directory, target_directory):
+        """Test that icons that no longer exist upstream are removed when pruning.
+        """
+        result = sync(checkout_directory, 'repository', 'master', target_directory=target_directory, prune=True)
+
+        assert result.removed == ['removed.svg']
+        assert not (target_directory / 'icons' / 'removed.svg').exists()
+        assert result.icon_hashes == hash_icons(target_directory / 'icons')
+
+    def test_generated_artifacts(self, checkout_directory, target_directory):
+        """Test the content of the generated stubs, manifest and update log.
+        """
+        sync(checkout_directory, 'repository', 'master', target_directory=target_directory, prune=True)
+
+        stubs = (target_directory / STUBS_FILE_NAME).read_text()
+        assert stubs.endswith('    _123: QIcon\n    arrow_left: QIcon\n    users: QIcon\n')
+
+        manifest = json.loads((target_directory / 'icons' / MANIFEST_FILE_NAME).read_text())
+        assert manifest == hash_icons(checkout_directory / 'icons')
+
+        update_log = (target_directory / 'icons' / UPDATE_LOG_FILE_NAME).read_text()
+        assert 'icons_before: 3\n' in update_log
+        assert 'icons_after: 3\n' in update_log
+        assert 'icons_added: 1\n' in update_log
+
+    def test_sync_reproducible(self, checkout_directory, target_directory):
+        """Test that syncing again without upstream changes leaves the generated artifacts untouched.
+        """
+        sync(checkout_directory, 'repository', 'master', target_directory=target_directory)
+        artifact_paths = [
+            target_directory / STUBS_FILE_NAME,
+            target_directory / 'icons' / MANIFEST_FILE_NAME,
+            target_directory / 'icons' / UPDATE_LOG_FILE_NAME,
+        ]
+        modified_times = [path.stat().st_mtime_ns for path in artifact_paths]
+
+        result = sync(checkout_directory, 'repository', 'master', target_directory=target_directory)
+
+        assert not result.has_changes
+        assert [path.stat().st_mtime_ns for path in artifact_paths] == modified_times
+
+    def test_get_current_branch(self, checkout_directory):
+        """Test reading the branch checked out in a local checkout.
+        """
+        assert get_current_branch(checkout_directory) == 'unknown'
+
+        git = ['git', '-C', str(checkout_directory), '-c', 'user.name=test', '-c', 'user.email=test@example.com']
+        subprocess.run(git + ['init', '-q'], check=True)
+        subprocess.run(git + ['checkout', '-q', '-b', 'release'], check=True)
+        subprocess.run(git + ['add', '-A'], check=True)
+        subprocess.run(git + ['commit', '-q', '-m', 'Release'], check=True)
+
+        assert get_current_branch(checkout_directory) == 'release'
+
+    def test_main_branch_with_source(self, checkout_directory):
+        """Test that --branch is rejected with --source, since the local checkout is used as is.
+        """
+        with pytest.raises(SystemExit):
+            main(['--source', str(checkout_directory), '--branch', 'main'])